@@ -42,7 +42,7 @@ from argos.widgets.mainwindow import MainWindow, UpdateReason
 logger = logging.getLogger(__name__)
 
 
-_Q_APP = None # Keep reference to QApplication instance to prevent garbage collection
+_Q_APP = None # Keep reference to QApplication instance to prevent garbage collection (and cache it)
 
 
 def qApplicationSingleton():
@@ -52,10 +52,15 @@ def qApplicationSingleton():
     """
     global _Q_APP
 
+    if _Q_APP is not None:
+        return _Q_APP
+
     qApp = QtWidgets.QApplication.instance()
     if qApp is None:
-        _Q_APP = qApp = QtWidgets.QApplication([])
+        logger.debug("Creating QApplication")
+        qApp = initQApplication()
 
+    _Q_APP = qApp
     return qApp
 
 
@@ -173,15 +178,7 @@ class ArgosApplication(QtCore.QObject):
 
             :rtype QtWidgets.QApplication:
         """
-        # TODO: replace the lines below by qApplicationSingleton()
-        global _Q_APP
-
-        qApp = QtWidgets.QApplication.instance()
-        if qApp is None:
-            logger.debug("Creating QApplication")
-            _Q_APP = qApp = initQApplication()
-
-        return qApp
+        return qApplicationSingleton()
 
 
     @property
@@ -270,6 +267,7 @@ class ArgosApplication(QtCore.QObject):
 
         cfg['plugins'] = {}
         cfg['plugins']['inspectors'] = self.inspectorRegistry.marshall()
+        cfg['plugins']['inspector-entry-points'] = self.inspectorRegistry.offeredEntryPoints
         cfg['plugins']['file-formats'] = self.rtiRegistry.marshall()
 
         # Save windows as a dict instead of a list to improve readability of the resulting JSON
@@ -303,6 +301,7 @@ class ArgosApplication(QtCore.QObject):
         pluginCfg = cfg.get('plugins', {})
 
         self.inspectorRegistry.unmarshall(pluginCfg.get('inspectors', {}))
+        self.inspectorRegistry.addNewEntryPoints(pluginCfg.get('inspector-entry-points'))
         self.rtiRegistry.unmarshall(pluginCfg.get('file-formats', {}))
 
         for winId, winCfg in cfg.get('windows', {}).items():
@@ -400,9 +399,11 @@ class ArgosApplication(QtCore.QObject):
                 For example filePatterns = ['my_file.nc, 'your_file.nc']
                 For example filePatterns = ['*.h5']
         """
+        fileNames = []
         for filePattern in filePatterns:
-            for fileName in glob.glob(filePattern):
-                self.repo.loadFile(fileName, rtiRegItem=None)
+            fileNames.extend(glob.glob(filePattern))
+
+        self.repo.loadFiles(fileNames, rtiRegItem=None)
 
 
     def getRecentFiles(self):
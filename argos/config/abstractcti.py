@@ -18,11 +18,12 @@
 """ Abstract base classes for modeling data tree items for use in the ConfigTreeModel
 """
 import enum
-import logging, os
+import logging
 
-from argos.info import DEBUGGING, icons_directory
+from argos.info import DEBUGGING
 from argos.qt import Qt, QtCore, QtGui, QtWidgets, QtSlot
 from argos.qt.treeitems import BaseTreeItem
+from argos.widgets.misc import loadIcon
 
 
 logger = logging.getLogger(__name__)
@@ -461,7 +462,7 @@ class AbstractCtiEditor(QtWidgets.QWidget):
         self.resetButton = QtWidgets.QToolButton()
         self.resetButton.setText("Reset")
         self.resetButton.setToolTip("Reset to default value.")
-        self.resetButton.setIcon(QtGui.QIcon(os.path.join(icons_directory(), 'reset-l.svg')))
+        self.resetButton.setIcon(loadIcon('reset-l.svg'))
         self.resetButton.setFocusPolicy(Qt.NoFocus)
         self.resetButton.clicked.connect(self.resetEditorValue)
         self.hBoxLayout.addWidget(self.resetButton, alignment=Qt.AlignRight)
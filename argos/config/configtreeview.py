@@ -21,16 +21,15 @@ from __future__ import print_function
 
 import enum
 import logging
-import os.path
 
 from argos.config.abstractcti import ResetMode
 from argos.config.configitemdelegate import ConfigItemDelegate
 from argos.config.configtreemodel import ConfigTreeModel
-from argos.info import DEBUGGING, icons_directory
-from argos.qt import Qt, QtCore, QtGui, QtWidgets, QtSlot
+from argos.info import DEBUGGING
+from argos.qt import Qt, QtCore, QtWidgets, QtSlot
 from argos.widgets.argostreeview import ArgosTreeView
 from argos.widgets.constants import RIGHT_DOCK_WIDTH, DOCK_SPACING, DOCK_MARGIN
-from argos.widgets.misc import BasePanel
+from argos.widgets.misc import BasePanel, loadIcon
 from argos.utils.cls import check_class
 
 logger = logging.getLogger(__name__)
@@ -72,13 +71,13 @@ class ConfigWidget(BasePanel):
 
         self.resetAllAction = QtWidgets.QAction("Reset All", self)
         self.resetAllAction.setToolTip("Resets all settings.")
-        self.resetAllAction.setIcon(QtGui.QIcon(os.path.join(icons_directory(), 'reset-l.svg')))
+        self.resetAllAction.setIcon(loadIcon('reset-l.svg'))
         self.resetAllAction.setShortcut("Ctrl+=")
 
         self.resetRangesAction = QtWidgets.QAction("Reset Ranges", self)
         self.resetRangesAction.setToolTip(
             "Resets range of all plots, color scales, table column/row sizes etc.")
-        self.resetRangesAction.setIcon(QtGui.QIcon(os.path.join(icons_directory(), 'reset-l.svg')))
+        self.resetRangesAction.setIcon(loadIcon('reset-l.svg'))
         self.resetRangesAction.setShortcut("Ctrl+0")
 
         self.resetButtonMenu = QtWidgets.QMenu()
@@ -17,10 +17,25 @@
 
 """ Version and other info for this program
 """
+import functools
 import os, sys
 
-# We bypass the argparse mechanism in main.py because this import is executed before main.main()
-DEBUGGING = ('-d' in sys.argv or '--debug' in sys.argv)
+@functools.lru_cache(maxsize=1)
+def is_debugging():
+    """ Returns True if Argos runs in debugging mode.
+
+        This is the case if the ARGOS_DEBUG environment variable is set to 1, or if the -d or
+        --debugging-mode command line option is given.
+
+        We bypass the argparse mechanism in main.py because this function is needed before
+        main.main() parses the command line (e.g. to set the DEBUGGING constant below).
+    """
+    return (os.environ.get('ARGOS_DEBUG', '') == '1' or
+            '-d' in sys.argv or '--debug' in sys.argv or '--debugging-mode' in sys.argv)
+
+
+# For use in the rest of the code. Can only be changed before the other modules are imported.
+DEBUGGING = is_debugging()
 TESTING = True # add some test menu options
 PROFILING = False# and DEBUGGING
 
@@ -49,8 +64,11 @@ def program_directory():
     return os.path.abspath(os.path.dirname(__file__))
 
 
+@functools.lru_cache(maxsize=1)
 def resource_directory():
     """ Returns directory with resources (images, style sheets, etc)
+
+        The result is cached as it doesn't change during the lifetime of the program.
     """
     return os.path.join(program_directory(), 'img/')
 
@@ -20,12 +20,15 @@
 import logging
 
 from argos.info import DEBUGGING
-from argos.reg.basereg import BaseRegItem, BaseRegistry, RegType
+from argos.reg.basereg import BaseRegItem, BaseRegistry, RegType, findEntryPoints
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_INSPECTOR = 'Table'
 
+# Other packages can add inspectors to the default plugins by defining entry points in this group.
+INSPECTOR_ENTRY_POINT_GROUP = 'argos.inspectors'
+
 class InspectorRegItem(BaseRegItem):
     """ Class to keep track of a registered Inspector.
         Has a create() method that functions as an Inspector factory.
@@ -87,6 +90,18 @@ class InspectorRegistry(BaseRegistry):
         """
         super(InspectorRegistry, self).__init__()
 
+        # Names of the entry point inspectors that have been added to the registry at some point.
+        # Is stored in the persistent settings so that inspectors that are removed by the user
+        # are not added again.
+        self._offeredEntryPoints = set()
+
+
+    @property
+    def offeredEntryPoints(self):
+        """ Sorted list with the names of entry point inspectors that have been added before.
+        """
+        return sorted(self._offeredEntryPoints)
+
 
     @property
     def registryName(self):
@@ -97,6 +112,9 @@ class InspectorRegistry(BaseRegistry):
 
     def getDefaultItems(self):
         """ Returns a list with the default plugins in the inspector registry.
+
+            These are the inspectors of Argos itself, plus those that are registered as entry
+            points in the INSPECTOR_ENTRY_POINT_GROUP group.
         """
         plugins = [
             InspectorRegItem('Line Plot',
@@ -117,4 +135,45 @@ class InspectorRegistry(BaseRegistry):
                                             'argos.inspector.pgplugins.old_imageplot2d.PgImagePlot2d'))
             plugins.append(InspectorRegItem('Debug Inspector',
                                             'argos.inspector.debug.DebugInspector'))
+
+        plugins.extend(self._entryPointItems(set(plugin.name for plugin in plugins)))
         return plugins
+
+
+    def addNewEntryPoints(self, offeredEntryPoints=None):
+        """ Appends the entry point inspectors that have not been offered to the user before.
+
+            This way plugin packages that are installed later also show up, while entry point
+            inspectors that the user has removed from the registry are not added again.
+            Should be called once, after the registry is read from the persistent settings.
+
+            :param offeredEntryPoints: names of the entry point inspectors that were offered
+                before (as stored in the persistent settings). If None, which is the case for
+                settings of older versions, only the inspectors already in the registry count.
+        """
+        if offeredEntryPoints is not None:
+            self._offeredEntryPoints.update(offeredEntryPoints)
+
+        names = set(item.name for item in self._items) | self._offeredEntryPoints
+        self._items.extend(self._entryPointItems(names))
+
+
+    def _entryPointItems(self, names):
+        """ Returns a list of InspectorRegItems of the entry points in INSPECTOR_ENTRY_POINT_GROUP.
+
+            :param names: set of names that are already registered or offered. Entry points with
+                one of these names are ignored. The names of the returned items are added to the
+                set. All entry points that are found are marked as offered.
+        """
+        items = []
+        for name, absClassName in findEntryPoints(INSPECTOR_ENTRY_POINT_GROUP):
+            self._offeredEntryPoints.add(name)
+            if name in names:
+                logger.debug("Inspector entry point {!r} already registered (ignored): {}"
+                             .format(name, absClassName))
+            else:
+                logger.info("Adding inspector from entry point {!r}: {}"
+                            .format(name, absClassName))
+                names.add(name)
+                items.append(InspectorRegItem(name, absClassName))
+        return items
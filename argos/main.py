@@ -23,23 +23,118 @@ from __future__ import print_function
 # Do not do any imports here that (indirectly) import any dependencies (PyQt, numpy, etc)
 # The browse function is imported by the argos package, which in turn is imported by setup.py.
 # If you import (for instance) numpy here, the setup.py will fail if numpy is not installed.
-# Therefore we do all imports from the argos package in the functions here.
+# Therefore we do all imports from the argos package in the functions here, or use a LazyImport
+# proxy, which only imports the module when it is actually used.
 
 import argparse
+import functools
 import glob
+import importlib
 import logging
 import os
 import os.path
 import sys
+import threading
 
-logging.captureWarnings(True)
-
+from argos.utils.lazyimport import LazyImport
 
 logger = logging.getLogger('argos')
 
-logging.basicConfig(level='DEBUG', stream=sys.stderr,
-                    #format='%(name)35s %(asctime)s %(filename)25s:%(lineno)-4d : %(levelname)-8s: %(message)s')
-                    format='%(asctime)s %(filename)25s:%(lineno)-4d : %(levelname)-8s: %(message)s')
+# Modules that (indirectly) import PyQt and numpy. They are imported on first use so that code
+# paths that don't need them, such as 'argos --version', start fast.
+qt = LazyImport('argos.qt')
+qtBindings = LazyImport('argos.qt.bindings')
+application = LazyImport('argos.application')
+testdata = LazyImport('argos.repo.testdata')
+widgetsMisc = LazyImport('argos.widgets.misc')
+
+# Modules that are imported in a background thread, while the main thread initializes logging
+# and imports the Qt bindings. Do not add modules that (indirectly) import Qt here. Qt regards the
+# thread in which QtCore is first imported as the main (GUI) thread.
+BACKGROUND_IMPORTS = ('numpy', 'numpy.ma')
+
+_backgroundImportsDone = threading.Event()
+_backgroundImportsDone.set()  # No background imports in progress yet.
+
+
+def _importModules(moduleNames):
+    """ Imports the modules. Is executed in the background import thread.
+    """
+    try:
+        for moduleName in moduleNames:
+            try:
+                importlib.import_module(moduleName)
+            except Exception as ex:
+                # Ignored here. The main thread will raise it again when it imports the module.
+                logger.debug("Background import of %s failed: %s", moduleName, ex)
+    finally:
+        _backgroundImportsDone.set()
+
+
+def startBackgroundImports(moduleNames=BACKGROUND_IMPORTS):
+    """ Starts importing the modules in a (daemon) background thread.
+
+        Call waitForBackgroundImports() before using the modules.
+        Set the ARGOS_NO_BG_IMPORT environment variable to 1 to disable this (useful for debugging).
+    """
+    from argos.utils.cls import environment_var_to_bool
+
+    if environment_var_to_bool(os.environ.get('ARGOS_NO_BG_IMPORT', False)):
+        logger.debug("Background imports disabled by the ARGOS_NO_BG_IMPORT environment variable.")
+        return
+
+    _backgroundImportsDone.clear()
+    thread = threading.Thread(target=_importModules, args=(moduleNames,),
+                              name="BackgroundImports", daemon=True)
+    thread.start()
+
+
+def waitForBackgroundImports():
+    """ Blocks until the modules of startBackgroundImports have been imported.
+        Returns immediately if no background imports were started.
+    """
+    _backgroundImportsDone.wait()
+
+
+def initBasicLogging(captureWarnings=True):
+    """ Configures a basic stderr handler so that messages logged before initLogging are shown.
+
+        Is called by main(). It is not done at import time so that applications that use Argos as
+        a library can configure logging themselves.
+
+        :param captureWarnings: If True, warnings from the warnings module are logged as well.
+    """
+    # Don't collect thread and process info for each log record; the format below doesn't use it.
+    # The initLogging function enables it again if the log config needs it.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    if captureWarnings:
+        logging.captureWarnings(True)
+
+    logging.basicConfig(level='DEBUG', stream=sys.stderr,
+                        #format='%(name)35s %(asctime)s %(filename)25s:%(lineno)-4d : %(levelname)-8s: %(message)s')
+                        format='%(asctime)s %(filename)25s:%(lineno)-4d : %(levelname)-8s: %(message)s')
+
+
+@functools.lru_cache(maxsize=1)
+def _availableQtStyles():
+    """ Returns the set of Qt styles that are available on this computer (in lower case).
+
+        Qt matches style names case-insensitively, so the names are converted to lower case.
+    """
+    return frozenset(key.lower() for key in qt.QtWidgets.QStyleFactory.keys())
+
+
+@functools.lru_cache(maxsize=1)
+def defaultStyleSheet():
+    """ Returns the absolute path of the default Argos style sheet. Is computed once per process.
+    """
+    # Import in functions. See comments at the top for more details
+    from argos.info import resource_directory
+    return os.path.join(resource_directory(), "argos.css")
+
 
 # We are not using **kwargs here so IDEs can see which parameters are expected.
 def browse(fileNames=None,
@@ -58,22 +153,48 @@ def browse(fileNames=None,
         :param inspectorFullName: The full path name of the inspector that will be loaded
         :param qtStyle: name of qtStyle (E.g. fusion).
         :param styleSheet: a path to an optional Qt Cascading Style Sheet.
+            If None the default Argos style sheet will be used.
         :param settingsFile: file with persistent settings. If None a default will be used.
     """
     # Import in functions. See comments at the top for more details
     from argos.info import EXIT_CODE_RESTART
 
+    waitForBackgroundImports()
+
+    # The QApplication and its style are initialized once. They are reused after a restart.
+    try:
+        qt.QtWidgets.QApplication.setAttribute(qt.QtCore.Qt.AA_UseHighDpiPixmaps)
+    except Exception as ex:
+        logger.debug("AA_UseHighDpiPixmaps not available in PyQt4: %s", ex)
+
+    application.qApplicationSingleton()
+
+    if qtStyle:
+        if qtStyle.lower() not in _availableQtStyles():
+            logger.warning("Qt style '%s' is not available on this computer. Use one of: %s",
+                           qtStyle, qt.QtWidgets.QStyleFactory.keys())
+        else:
+            widgetsMisc.setApplicationQtStyle(qtStyle)
+
+    if not styleSheet:
+        styleSheet = defaultStyleSheet()
+
+    qss = widgetsMisc.readStyleSheet(styleSheet)
+    if qss is None:
+        print("Stylesheet not found: {}".format(styleSheet), file=sys.stderr)
+        #sys.exit(2)
+    else:
+        widgetsMisc.setApplicationStyleSheet(qss)
+
     while True:
         logger.info("Starting browse window...")
         exitCode = _browse(
             fileNames=fileNames,
             select=select,
             inspectorFullName=inspectorFullName,
-            qtStyle=qtStyle,
-            styleSheet=styleSheet,
             settingsFile=settingsFile)
 
-        logger.info("Argos finished with exit code: {}".format(exitCode))
+        logger.info("Argos finished with exit code: %s", exitCode)
         if exitCode != EXIT_CODE_RESTART:
             return exitCode
         else:
@@ -84,46 +205,23 @@ def browse(fileNames=None,
 def _browse(fileNames=None,
             select=None,
             inspectorFullName=None,
-            qtStyle=None,
-            styleSheet=None,
             settingsFile=None):
     """ Execute browse a single time
+
+        Creates a new ArgosApplication, which is discarded when this function returns. The
+        QApplication must already exist (see browse).
     """
     # Import in functions. See comments at the top for more details.
-    from argos.info import DEBUGGING
-    from argos.qt import QtWidgets, QtCore
-    from argos.application import ArgosApplication
-    from argos.repo.testdata import createArgosTestData
-    from argos.widgets.misc import setApplicationQtStyle, setApplicationStyleSheet
+    from argos.info import is_debugging
 
-    argosApp = ArgosApplication(settingsFile)
+    argosApp = application.ArgosApplication(settingsFile)
     argosApp.loadSettings(inspectorFullName)  # TODO: call in constructor?
 
-    try:
-        QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps)
-    except Exception as ex:
-        logger.debug("AA_UseHighDpiPixmaps not available in PyQt4: {}".format(ex))
-
-    if qtStyle:
-        availableStyles = QtWidgets.QStyleFactory.keys()
-        if  qtStyle not in availableStyles:
-            logger.warning("Qt style '{}' is not available on this computer. Use one of: {}"
-                           .format(qtStyle, availableStyles))
-        else:
-            setApplicationQtStyle(qtStyle)
-
-    if not os.path.exists(styleSheet):
-        msg = "Stylesheet not found: {}".format(styleSheet)
-        print(msg, file=sys.stderr)
-        logger.warning(msg)
-        #sys.exit(2)
-    setApplicationStyleSheet(styleSheet)
-
     # Load data in common repository before windows are created.
     argosApp.loadFiles(fileNames)
 
-    if DEBUGGING:
-        argosApp.repo.insertItem(createArgosTestData())
+    if is_debugging():
+        argosApp.repo.insertItem(testdata.createArgosTestData())
 
     if select:
         for mainWindow in argosApp.mainWindows:
@@ -135,10 +233,9 @@ def _browse(fileNames=None,
 def printInspectors(settingsFile):
     """ Prints a list of inspectors
     """
-    # Imported here so this module can be imported without Qt being installed.
-    from argos.application import ArgosApplication
+    waitForBackgroundImports()
 
-    argosApp = ArgosApplication(settingsFile)
+    argosApp = application.ArgosApplication(settingsFile)
     argosApp.loadSettings(None)
 
     print("# Argos' registered inspectors")
@@ -150,7 +247,7 @@ def main():
     """ Starts Argos main window
     """
     # Import in functions. See comments at the top for more details
-    from argos.info import DEBUGGING, PROJECT_NAME, VERSION, EXIT_CODE_RESTART, resource_directory
+    from argos.info import is_debugging, PROJECT_NAME, VERSION, EXIT_CODE_RESTART
     from argos.utils.logs import initLogging
     from argos.utils.misc import remove_process_serial_number
 
@@ -186,7 +283,8 @@ def main():
              "file is loaded/saved to the argos settings directory.")
 
     parser.add_argument('-d', '--debugging-mode', dest='debugging', action = 'store_true',
-        help="Run Argos in debugging mode. Useful during development.")
+        help="Run Argos in debugging mode. Useful during development. Setting the ARGOS_DEBUG "
+             "environment variable to 1 has the same effect.")
 
     parser.add_argument('--log-config', dest='logConfigFileName',
                         help='Logging configuration file. If not set a default will be used.')
@@ -203,12 +301,15 @@ def main():
 
     args = parser.parse_args(remove_process_serial_number(sys.argv[1:]))
 
-    initLogging(args.logConfigFileName, args.log_level)
-
     if args.version:
         print(aboutStr)
         sys.exit(0)
 
+    initBasicLogging()
+    startBackgroundImports()
+
+    initLogging(args.logConfigFileName, args.log_level)
+
     if args.list_inspectors:
         printInspectors(args.settingsFile)
         sys.exit(0)
@@ -218,31 +319,24 @@ def main():
     logger.info("######################################")
     logger.info(aboutStr)
 
-    logger.debug("argv: {}".format(sys.argv))
-    logger.debug("Main argos module file: {}".format(__file__))
-    logger.debug("PID: {}".format(os.getpid()))
+    logger.debug("argv: %s", sys.argv)
+    logger.debug("Main argos module file: %s", __file__)
+    logger.debug("PID: %s", os.getpid())
 
-    if DEBUGGING:
+    if is_debugging():
         logger.warning("Debugging flag is on!")
 
-    logger.info('Started {} {}'.format(PROJECT_NAME, VERSION))
-    logger.info("Python version: {}".format(sys.version).replace('\n', ''))
-
-    # Imported here so this module can be imported without Qt being installed.
-    from argos.qt.bindings import QT_API_NAME
-    logger.info("Using {} Python Qt bindings".format(QT_API_NAME))
+    logger.info('Started %s %s', PROJECT_NAME, VERSION)
+    logger.info("Python version: %s", sys.version.replace('\n', ''))
 
-    # The DEBUGGING 'constant' is set before the arguments are parsed by argparse.
-    # Sanity check for consistency.
-    assert args.debugging == DEBUGGING, ("Inconsistent debugging mode. {} != {}"
-                                         .format(args.debugging, DEBUGGING))
+    logger.info("Using %s Python Qt bindings", qtBindings.QT_API_NAME)
 
     qtStyle = args.qtStyle if args.qtStyle else os.environ.get("QT_STYLE_OVERRIDE", 'Fusion')
     styleSheet = args.styleSheet if args.styleSheet else os.environ.get("ARGOS_STYLE_SHEET", '')
 
     if not styleSheet:
-        styleSheet = os.path.join(resource_directory(), "argos.css")
-        logger.debug("Using default style sheet: {}".format(styleSheet))
+        styleSheet = defaultStyleSheet()
+        logger.debug("Using default style sheet: %s", styleSheet)
     else:
         styleSheet = os.path.abspath(styleSheet)
 
@@ -266,7 +360,7 @@ def main():
            qtStyle=qtStyle,
            styleSheet=styleSheet,
            settingsFile=args.settingsFile)
-    logger.info('Done {}'.format(PROJECT_NAME))
+    logger.info('Done %s', PROJECT_NAME)
 
 if __name__ == "__main__":
     main()
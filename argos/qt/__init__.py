@@ -18,7 +18,27 @@
 """ Contains classes and functions based on Qt. These could in principle be useful for
     other projects but would then require minor tweaking (e.g. imports).
 """
-# Import commonly used function into the package name space for convenience.
+# Commonly used functions are available in the package name space for convenience. They are
+# imported on first access (PEP 562) so that importing argos.qt doesn't import the Qt bindings.
 
-from argos.qt.bindings import Qt, QUrl, QtCore, QtGui, QtWidgets, QtSvg, QtSignal, QtSlot
-from argos.qt.misc import initQApplication #, initQCoreApplication
+_BINDINGS_SYMBOLS = ('Qt', 'QUrl', 'QtCore', 'QtGui', 'QtWidgets', 'QtSvg', 'QtSignal', 'QtSlot')
+_MISC_SYMBOLS = ('initQApplication', ) # 'initQCoreApplication'
+
+
+def __getattr__(name):
+    """ Imports the Qt bindings (or qt.misc module) when one of their symbols is first accessed.
+    """
+    if name in _BINDINGS_SYMBOLS:
+        from argos.qt import bindings as module
+    elif name in _MISC_SYMBOLS:
+        from argos.qt import misc as module
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(module, name)
+    globals()[name] = value # Subsequent lookups don't go through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_BINDINGS_SYMBOLS) + list(_MISC_SYMBOLS))
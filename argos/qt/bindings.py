@@ -42,7 +42,7 @@ if QT_API_NAME is None:
     try:
         import PyQt5
     except ModuleNotFoundError as ex:
-        logger.debug("Tried but failed to import PyQt5: {}".format(ex))
+        logger.debug("Tried but failed to import PyQt5: %s", ex)
         pass
     else:
         QT_API_NAME = API_PYQT5
@@ -51,7 +51,7 @@ if QT_API_NAME is None:
     try:
         import PySide2
     except ModuleNotFoundError as ex:
-        logger.debug("Tried but failed to import PySide2: {}".format(ex))
+        logger.debug("Tried but failed to import PySide2: %s", ex)
     else:
         QT_API_NAME = API_PYSIDE2
 
@@ -62,6 +62,8 @@ if QT_API_NAME == API_PYQT5:
     from PyQt5 import QtCore, QtGui, QtWidgets, QtSvg
     from PyQt5.QtCore import Qt, QUrl
     from PyQt5.QtCore import pyqtSignal as QtSignal
+    # The slots are not wrapped to check their result or catch exceptions; uncaught exceptions
+    # are handled by sys.excepthook (see argos.qt.misc.handleException). Slots must return None.
     from PyQt5.QtCore import pyqtSlot as QtSlot
     from PyQt5.Qt import PYQT_VERSION_STR as PYQT_VERSION
     from PyQt5.Qt import QT_VERSION_STR as QT_VERSION
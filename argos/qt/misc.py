@@ -49,7 +49,7 @@ def initQApplication():
     if 'darwin' in sys.platform:
         graphicsSystem = "raster" # raster, native or opengl
         os.environ.setdefault('QT_GRAPHICSSYSTEM', graphicsSystem)
-        logger.info("Setting QT_GRAPHICSSYSTEM to: {}".format(graphicsSystem))
+        logger.info("Setting QT_GRAPHICSSYSTEM to: %s", graphicsSystem)
 
     app = QtWidgets.QApplication(sys.argv)
     initArgosApplicationSettings(app)
@@ -108,10 +108,13 @@ class ResizeDetailsMessageBox(QtWidgets.QMessageBox):
 
 
 def handleException(exc_type, exc_value, exc_traceback):
+    """ Handles uncaught exceptions. Is installed as sys.excepthook by the ArgosApplication.
 
-    traceback.format_exception(exc_type, exc_value, exc_traceback)
+        This is also the only place where exceptions in Qt slots are caught; the slots themselves
+        are not wrapped.
+    """
 
-    logger.critical("Bug: uncaught {}".format(exc_type.__name__),
+    logger.critical("Bug: uncaught %s", exc_type.__name__,
                     exc_info=(exc_type, exc_value, exc_traceback))
     if info.DEBUGGING:
         logger.info("Quitting application with exit code 1")
@@ -178,20 +181,25 @@ def getWidgetState(qWindow):
 ######################
 
 def printChildren(obj, indent=""):
-    """ Recursively prints the children of a QObject. Useful for debugging.
+    """ Prints the children of a QObject, and their children, etc. Useful for debugging.
+
+        The tree is traversed depth-first without recursion and written to stdout in one go.
     """
-    children=obj.children()
-    if children==None:
-        return
-    for child in children:
+    lines = []
+    stack = [(child, indent) for child in reversed(obj.children())]
+    while stack:
+        child, childIndent = stack.pop()
         try:
             childName = child.objectName()
         except AttributeError:
             childName = "<no-name>"
 
-        #print ("{}{:10s}: {}".format(indent, childName, child.__class__))
-        print ("{}{!r}: {}".format(indent, childName, child.__class__))
-        printChildren(child, indent + "    ")
+        #lines.append("{}{:10s}: {}\n".format(childIndent, childName, child.__class__))
+        lines.append("{}{!r}: {}\n".format(childIndent, childName, child.__class__))
+        grandChildIndent = childIndent + "    "
+        stack.extend((grandChild, grandChildIndent) for grandChild in reversed(child.children()))
+
+    sys.stdout.write("".join(lines))
 
 
 def printAllWidgets(qApplication, ofType=None):
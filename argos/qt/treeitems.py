@@ -11,7 +11,12 @@ class BaseTreeItem(object):
 
         The tree items have no notion of which field is stored in which column. This is implemented
         in BaseTreeModel._itemValueForColumn
+
+        The attributes are declared in __slots__ so that trees with many items use less memory.
+        Descendants that don't define __slots__ themselves will have a __dict__ as usual.
     """
+    __slots__ = ('_nodeName', '_parentItem', '_model', '_childItems', '_nodePath')
+
     def __init__(self, nodeName):
         """ Constructor
 
@@ -273,6 +278,8 @@ class AbstractLazyLoadTreeItem(BaseTreeItem):
     """ Abstract base class for a tree item that can do lazy loading of children.
         Descendants should override the _fetchAllChildren
     """
+    __slots__ = ('_canFetchChildren', )
+
     def __init__(self, nodeName=''):
         """ Constructor
         """
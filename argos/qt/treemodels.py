@@ -332,6 +332,21 @@ class BaseTreeModel(QtCore.QAbstractItemModel):
             If position is None the child will be appended as the last child of the parent.
             Returns the index of the new inserted child.
         """
+        return self.insertItems([childItem], position=position, parentIndex=parentIndex)[0]
+
+
+    def insertItems(self, childItems, position=None, parentIndex=None):
+        """ Inserts a list of childItems before row 'position' under the parent index.
+
+            All items are inserted between a single beginInsertRows/endInsertRows pair, so the
+            views are only updated once. This is much faster than inserting them one by one.
+
+            If position is None the children will be appended as the last children of the parent.
+            Returns a list with the indexes of the new inserted children.
+        """
+        if not childItems:
+            return []
+
         if parentIndex is None:
             parentIndex=QtCore.QModelIndex()
 
@@ -344,15 +359,18 @@ class BaseTreeModel(QtCore.QAbstractItemModel):
         assert 0 <= position <= nChildren, \
             "position should be 0 < {} <= {}".format(position, nChildren)
 
-        self.beginInsertRows(parentIndex, position, position)
+        lastPosition = position + len(childItems) - 1
+        self.beginInsertRows(parentIndex, position, lastPosition)
         try:
-            parentItem.insertChild(childItem, position)
+            for row, childItem in enumerate(childItems, start=position):
+                parentItem.insertChild(childItem, row)
         finally:
             self.endInsertRows()
 
-        childIndex = self.index(position, 0, parentIndex)
-        assert childIndex.isValid(), "Sanity check failed: childIndex not valid"
-        return childIndex
+        childIndexes = [self.index(row, 0, parentIndex) for row in range(position, lastPosition + 1)]
+        assert all(childIndex.isValid() for childIndex in childIndexes), \
+            "Sanity check failed: childIndex not valid"
+        return childIndexes
 
 
     def removeAllChildrenAtIndex(self, parentIndex):
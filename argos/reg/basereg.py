@@ -47,6 +47,40 @@ def nameToIdentifier(fullName):
     return string_to_identifier(fullName, white_space_becomes='')
 
 
+def findEntryPoints(group):
+    """ Returns a list of (name, absClassName) tuples of the entry points in the group.
+
+        This allows other packages to register plugins in their setup.py. For example:
+            entry_points={'argos.inspectors': ['My Inspector = mypackage.mymodule:MyInspector']}
+
+        The entry points are not loaded, since registered classes are only imported when needed.
+        The 'module:symbol' entry point value is converted to a dot separated absClassName.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        logger.debug("No importlib.metadata (Python < 3.8). Entry points are not searched.")
+        return []
+
+    try:
+        allEntryPoints = entry_points()
+        if hasattr(allEntryPoints, 'select'):
+            entryPoints = allEntryPoints.select(group=group)
+        else:
+            entryPoints = allEntryPoints.get(group, [])  # Python < 3.10 returns a dict
+    except Exception as ex:
+        logger.warning("Unable to search for entry points {!r}: {}".format(group, ex))
+        return []
+
+    result = []
+    for entryPoint in entryPoints:
+        absClassName = entryPoint.value.split('[')[0].strip().replace(':', '.') # Remove extras
+        logger.debug("Found entry point {!r}: {}".format(entryPoint.name, absClassName))
+        result.append((entryPoint.name, absClassName))
+    return result
+
+
+
 class BaseRegItem(BaseItem):
     """ Represents a class that is registered in the registry.
 
@@ -298,11 +332,11 @@ class BaseRegistryModel(BaseTableModel):
     def data(self, index, role=Qt.DisplayRole):
         """ Returns the data stored under the given role for the item referred to by the index.
         """
-        if not index.isValid():
-            return None
-
         if role == Qt.ForegroundRole:
-            item = self._store.items[index.row()]
+            if not index.isValid():
+                return None
+
+            item = self._items[index.row()]
 
             if item.successfullyImported is None:
                 return self.notImportedBrush
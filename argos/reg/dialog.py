@@ -20,10 +20,8 @@ from __future__ import print_function
 
 import copy
 import logging
-import os.path
 import sys
 
-from argos.info import icons_directory
 from argos.qt import QtCore, QtGui, QtWidgets, Qt, QtSlot
 from argos.qt.colorselect import ColorSelectWidget
 from argos.qt.shortcutedit import ShortCutEditor
@@ -31,6 +29,7 @@ from argos.reg.basereg import BaseRegistryModel, BaseRegistry, RegType
 from argos.reg.tabview import TableEditWidget
 from argos.utils.cls import check_class
 from argos.widgets.constants import MONO_FONT, FONT_SIZE, COLOR_ERROR
+from argos.widgets.misc import loadIcon
 #from argos.widgets.constants import QCOLOR_REGULAR, QCOLOR_NOT_IMPORTED, QCOLOR_ERROR
 
 logger = logging.getLogger(__name__)
@@ -134,7 +133,7 @@ class PluginsDialog(QtWidgets.QDialog):
 
         self.resetButton = QtWidgets.QPushButton("Reset Table to Defaults...")
         self.resetButton.clicked.connect(self.resetToDefaults)
-        self.resetButton.setIcon(QtGui.QIcon(os.path.join(icons_directory(), 'reset-l.svg')))
+        self.resetButton.setIcon(loadIcon('reset-l.svg'))
 
         # We use a button layout instead of a QButtonBox because there always will be a default
         # button (e.g. the Save button) that will light up, even if another widget has the focus.
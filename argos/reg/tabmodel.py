@@ -26,6 +26,14 @@ from argos.qt import QtCore, QtSignal, Qt
 
 logger = logging.getLogger(__name__)
 
+# Qt constants that are used in the headerData and data methods. These are called very often by
+# the views so we save the attribute look ups by binding them as module constants.
+_DISPLAY_ROLE = Qt.DisplayRole
+_DECORATION_ROLE = Qt.DecorationRole
+_STRING_ROLES = (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole) # roles that return the cell string
+_DATA_ROLES = _STRING_ROLES + (Qt.DecorationRole, )
+_HORIZONTAL = Qt.Horizontal
+
 
 class BaseItem(object):
     """ An object that is stored in the BaseItemStore.
@@ -237,6 +245,18 @@ class BaseTableModel(QtCore.QAbstractTableModel):
         self._store = store
         self._fieldNames = self._store.fieldNames
         self._fieldLabels = self.store.fieldLabels
+        self._numCols = len(self._fieldNames)
+        self._items = [] # Reference to self._store.items. Is set in self._rebuildCache
+        self._numRows = 0 # Cached len(self._store.items). Is set in self._rebuildCache
+
+        # Column-major cache with the string representation of the cells: self._strCache[col][row]
+        # The data method is called very often by the views so we don't want to convert the cells
+        # to strings each time. The cache is rebuilt when the model is reset.
+        self._strCache = []
+        self._verHeaders = [] # Cached vertical header labels
+        self._rebuildCache()
+        self.modelReset.connect(self._rebuildCache)
+
 
     @property
     def store(self):
@@ -249,14 +269,38 @@ class BaseTableModel(QtCore.QAbstractTableModel):
         return self._store
 
 
+    def _rebuildCache(self):
+        """ Rebuilds the cache with the string representation of all cells.
+
+            Also renews the reference to the list of store items, the store may have replaced it.
+        """
+        self._items = items = self._store.items
+        self._strCache = [[str(item.data[fieldName]) for item in items]
+                          for fieldName in self._fieldNames]
+        self._verHeaders = [str(row) for row in range(len(items))]
+        self._numRows = len(items)
+
+
+    def _updateCacheRow(self, row, insert=False):
+        """ Updates the string representation of the cells in a row of the cache.
+            If insert is True, the row is inserted in the cache.
+        """
+        item = self._store.items[row]
+        for colCache, fieldName in zip(self._strCache, self._fieldNames):
+            if insert:
+                colCache.insert(row, str(item.data[fieldName]))
+            else:
+                colCache[row] = str(item.data[fieldName])
+
+
     def rowCount(self, parent=None):
         """ Returns the number of items in the registry."""
-        return len(self._store.items)
+        return self._numRows
 
 
     def columnCount(self, parent=None):
         """ Returns the number of columns of the registry."""
-        return len(self._fieldNames)
+        return self._numCols
 
 
     def itemFromIndex(self, index, altItem=None):
@@ -266,7 +310,7 @@ class BaseTableModel(QtCore.QAbstractTableModel):
         if not index.isValid():
             return altItem
         else:
-            return self._store.items[index.row()]
+            return self._items[index.row()]
 
 
     def indexFromItem(self, storeItem, col=0):
@@ -293,34 +337,31 @@ class BaseTableModel(QtCore.QAbstractTableModel):
         """ Returns the header for a section (row or column depending on orientation).
             Reimplemented from QAbstractTableModel to make the headers start at 0.
         """
-        if role == QtCore.Qt.DisplayRole:
-            if orientation == Qt.Horizontal:
-                return self._fieldLabels[section]
-            else:
-                return str(section)
-        else:
+        if role != _DISPLAY_ROLE:
             return None
 
+        if orientation == _HORIZONTAL:
+            return self._fieldLabels[section]
+        else:
+            return self._verHeaders[section]
+
 
     def data(self, index, role=Qt.DisplayRole):
         """ Returns the data stored under the given role for the item referred to by the index.
         """
-        if not index.isValid():
+        # Test the role first. It's cheaper than index.isValid() and most roles are not used.
+        if role not in _DATA_ROLES:
             return None
 
-        if role not in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole, Qt.DecorationRole):
+        if not index.isValid():
             return None
 
-        row = index.row()
-        col = index.column()
-        item = self._store.items[row]
-        attrName = self._fieldNames[col]
+        if role in _STRING_ROLES:
+            return self._strCache[index.column()][index.row()]
 
-        if role in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole):
-            return str(item.data[attrName])
-
-        elif role == Qt.DecorationRole:
-            if col == item.COL_DECORATION:
+        elif role == _DECORATION_ROLE:
+            item = self._items[index.row()]
+            if index.column() == item.COL_DECORATION:
                 return item.decoration
 
         # elif role == Qt.ForegroundRole:
@@ -351,10 +392,14 @@ class BaseTableModel(QtCore.QAbstractTableModel):
 
     def emitDataChanged(self, storeItem):
         """ Emits the dataChanged and sigItemChanged signals for the storeItem
+            Updates the cached cell strings of the item first.
         """
         leftIndex = self.indexFromItem(storeItem, col=0)
         rightIndex = self.indexFromItem(storeItem, col=-1)
 
+        if leftIndex.isValid():
+            self._updateCacheRow(leftIndex.row())
+
         logger.debug("Data changed: {} ... {}".format(self.data(leftIndex), self.data(rightIndex)))
         self.dataChanged.emit(leftIndex, rightIndex)
         self.sigItemChanged.emit(storeItem)
@@ -374,6 +419,9 @@ class BaseTableModel(QtCore.QAbstractTableModel):
         self.beginInsertRows(QtCore.QModelIndex(), row, row)
         try:
             self.store.items.insert(row, item)
+            self._updateCacheRow(row, insert=True)
+            self._verHeaders.append(str(len(self._verHeaders)))
+            self._numRows += 1
         finally:
             self.endInsertRows()
 
@@ -386,6 +434,10 @@ class BaseTableModel(QtCore.QAbstractTableModel):
         try:
             item = self.store.items[row]
             del self.store.items[row]
+            for colCache in self._strCache:
+                del colCache[row]
+            del self._verHeaders[-1]
+            self._numRows -= 1
             return item
         finally:
             self.endRemoveRows()
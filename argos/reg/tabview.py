@@ -19,14 +19,13 @@
 """
 
 import logging
-import os.path
 
 from argos.utils.cls import type_name, check_class
 
-from argos.info import icons_directory
 from argos.reg.tabmodel import BaseTableModel
-from argos.qt import QtCore, QtGui, QtWidgets, Qt
+from argos.qt import QtCore, QtWidgets, Qt
 from argos.qt.togglecolumn import ToggleColumnTableView
+from argos.widgets.misc import loadIcon
 
 
 logger = logging.getLogger(__name__)
@@ -114,19 +113,18 @@ class TableEditWidget(QtWidgets.QWidget):
         buttonLayout = QtWidgets.QVBoxLayout()
         self.mainLayout.addLayout(buttonLayout)
 
-        iconDir = icons_directory()
         iconSize = QtCore.QSize(20, 20)
 
         self.addButton = QtWidgets.QPushButton()
         self.addButton.setToolTip("Add new row.")
-        self.addButton.setIcon(QtGui.QIcon(os.path.join(iconDir, 'plus-sign-l.svg')))
+        self.addButton.setIcon(loadIcon('plus-sign-l.svg'))
         self.addButton.setIconSize(iconSize)
         self.addButton.clicked.connect(self.addRow)
         buttonLayout.addWidget(self.addButton)
 
         self.removeButton = QtWidgets.QPushButton()
         self.removeButton.setToolTip("Remove row.")
-        self.removeButton.setIcon(QtGui.QIcon(os.path.join(iconDir, 'minus-sign-l.svg')))
+        self.removeButton.setIcon(loadIcon('minus-sign-l.svg'))
         self.removeButton.setIconSize(iconSize)
         self.removeButton.clicked.connect(self.removeRow)
         buttonLayout.addWidget(self.removeButton)
@@ -134,14 +132,14 @@ class TableEditWidget(QtWidgets.QWidget):
 
         self.moveUpButton = QtWidgets.QPushButton()
         self.moveUpButton.setToolTip("Move row up")
-        self.moveUpButton.setIcon(QtGui.QIcon(os.path.join(iconDir, 'circle-arrow-up-l.svg')))
+        self.moveUpButton.setIcon(loadIcon('circle-arrow-up-l.svg'))
         self.moveUpButton.setIconSize(iconSize)
         self.moveUpButton.clicked.connect(lambda: self.moveRow(-1))
         buttonLayout.addWidget(self.moveUpButton)
 
         self.moveDownButton = QtWidgets.QPushButton()
         self.moveDownButton.setToolTip("Move row down")
-        self.moveDownButton.setIcon(QtGui.QIcon(os.path.join(iconDir, 'circle-arrow-down-l.svg')))
+        self.moveDownButton.setIcon(loadIcon('circle-arrow-down-l.svg'))
         self.moveDownButton.setIconSize(iconSize)
         self.moveDownButton.clicked.connect(lambda: self.moveRow(+1))
         buttonLayout.addWidget(self.moveDownButton)
@@ -21,6 +21,7 @@
 import logging
 import os
 import re
+import warnings
 
 from argos.external import six
 from argos.info import DEBUGGING
@@ -32,6 +33,18 @@ from argos.utils.defs import DIM_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+# Precomputed default dimension names. Arrays with more dimensions are very rare.
+_DIM_NAMES = tuple(DIM_TEMPLATE.format(dimNr) for dimNr in range(32))
+
+
+def numberedDimensionNames(nDims):
+    """ Returns a list with default names of nDims dimensions: ['dim-0', 'dim-1', ...]
+    """
+    if nDims <= len(_DIM_NAMES):
+        return list(_DIM_NAMES[:nDims])
+    else:
+        return [DIM_TEMPLATE.format(dimNr) for dimNr in range(nDims)]
+
 
 class BaseRti(AbstractLazyLoadTreeItem):
     """ TreeItem for use in a RepositoryTreeModel. (RTI = Repository TreeItem)
@@ -39,6 +52,8 @@ class BaseRti(AbstractLazyLoadTreeItem):
 
         Serves as an interface but can also be instantiated for debugging purposes.
     """
+    __slots__ = ('_iconColor', '_isOpen', '_exception', '_fileName')
+
     _defaultIconGlyph = None  # Can be overridden by defining a _iconGlyph attribute
     _defaultIconColor = None  # Can be overridden by defining a _iconColor attribute
 
@@ -47,17 +62,25 @@ class BaseRti(AbstractLazyLoadTreeItem):
 
             :param nodeName: name of this node (used to construct the node path).
             :param fileName: absolute path to the file where the data of this RTI originates.
+                Relative paths are converted to absolute paths. Absolute paths must be
+                normalized already (e.g. with normRealPath), as they are used as is.
         """
         super(BaseRti, self).__init__(nodeName=nodeName)
-        assert is_a_color_str(iconColor), \
-            "Icon color for {!r} not a hex string: {!r}".format(self, iconColor)
+
+        # An RTI is created for each file in a directory. These sanity checks of the (programmer
+        # supplied) parameters are therefore only done in debugging mode.
+        if DEBUGGING:
+            assert is_a_color_str(iconColor), \
+                "Icon color for {!r} not a hex string: {!r}".format(self, iconColor)
+            check_class(fileName, six.string_types, allow_none=True)
+
         self._iconColor = iconColor
 
         self._isOpen = False
         self._exception = None # Any exception that may occur when opening this item.
 
-        check_class(fileName, six.string_types, allow_none=True)
-        if fileName:
+        if fileName and not os.path.isabs(fileName):
+            # Child RTIs get absolute paths of their parents; only call abspath if needed.
             fileName = os.path.abspath(fileName)
         self._fileName = fileName
 
@@ -69,7 +92,12 @@ class BaseRti(AbstractLazyLoadTreeItem):
         logger.debug("createFromFileName {}, {}, color={}".format(cls, fileName, iconColor))
         # See https://julien.danjou.info/blog/2013/guide-python-static-class-abstract-methods
         #logger.debug("Trying to create object of class: {!r}".format(cls))
-        basename = os.path.basename(normRealPath(fileName)) # strips trailing slashes
+        if os.path.isabs(fileName):
+            # Absolute paths are normalized already (e.g. DirEntry.path of a directory scan).
+            # Don't call normRealPath, it would stat each child of a directory.
+            basename = os.path.basename(fileName.rstrip(os.sep))
+        else:
+            basename = os.path.basename(normRealPath(fileName)) # strips trailing slashes
         if not basename:
             logger.warning("Empty file name in path: {}. Using '<root>' as root path.")
             basename = '<root directory>'
@@ -85,12 +113,21 @@ class BaseRti(AbstractLazyLoadTreeItem):
 
     def finalize(self):
         """ Can be used to cleanup resources. Should be called explicitly.
-            Recursively calls the close method on all children and then on itself.
+            Calls the close method on all descendants and then on itself. Descendants are
+            closed before their parents.
             In turn, close calls _closeRecources; descendants should override the latter.
+
+            The tree is traversed iteratively so deep trees don't hit the recursion limit.
         """
-        for child in self.childItems:
-            child.finalize()
-        self.close()
+        items = [] # All items in the branch in pre-order
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            items.append(item)
+            stack.extend(item.childItems)
+
+        for item in reversed(items):
+            item.close()
 
 
     @property
@@ -103,6 +140,9 @@ class BaseRti(AbstractLazyLoadTreeItem):
         """ Opens underlying resources and sets isOpen flag.
             It calls _openResources. Descendants should usually override the latter
             function instead of this one.
+
+            Returns True if the item is open afterwards. If opening failed, the exception
+            property contains the reason.
         """
         self.clearException()
         try:
@@ -121,12 +161,23 @@ class BaseRti(AbstractLazyLoadTreeItem):
             else:
                 logger.warning("Model not set yet: {}".format(self))
 
+        except FileNotFoundError as ex:
+            # The file is not checked beforehand (EAFP): a missing file is found out here.
+            # An OSError/IOError with errno ENOENT is a FileNotFoundError as well. Other errors,
+            # e.g. of corrupt files, are logged with a traceback below.
+            if DEBUGGING:
+                raise
+            logger.error("Unable to open {}: {}".format(self, ex))
+            self.setException(ex)
+
         except Exception as ex:
             if DEBUGGING:
                 raise
             logger.exception("Error during tree item open: {}".format(ex))
             self.setException(ex)
 
+        return self._isOpen
+
 
     def _openResources(self):
         """ Can be overridden to open the underlying resources.
@@ -171,10 +222,14 @@ class BaseRti(AbstractLazyLoadTreeItem):
         pass
 
 
-    def _checkFileExists(self):
+    def checkFileExists(self):
         """ Verifies that the underlying file exists and sets the _exception attribute if not
             Returns True if the file exists.
             If self._fileName is None, nothing is checked and True is returned.
+
+            The RTI constructors don't call this; a missing file is detected when the RTI is
+            opened. The repository tree model calls it for files that are explicitly loaded or
+            reloaded by the user, for which it is not certain that they exist.
         """
         if self._fileName and not os.path.exists(self._fileName):
             msg = "File not found: {}".format(self._fileName)
@@ -184,6 +239,14 @@ class BaseRti(AbstractLazyLoadTreeItem):
         else:
             return True
 
+
+    def _checkFileExists(self):
+        """ Deprecated alias of checkFileExists, which is kept for existing plugins.
+        """
+        warnings.warn("BaseRti._checkFileExists is deprecated, use checkFileExists instead.",
+                      DeprecationWarning, stacklevel=2)
+        return self.checkFileExists()
+
     @property
     def exception(self):
         """ The exception if an error has occurred during reading
@@ -214,10 +277,8 @@ class BaseRti(AbstractLazyLoadTreeItem):
         try:
             self.clearException()
 
-            if not self.isOpen:
-                self.open() # Will set self._exception in case of failure
-
-            if not self.isOpen:
+            # Opening will set self._exception in case of failure
+            if not self._isOpen and not self.open():
                 logger.warning("Opening item failed during fetch (aborted)")
                 return [] # no need to continue if opening failed.
 
@@ -365,7 +426,7 @@ class BaseRti(AbstractLazyLoadTreeItem):
             The default implementation returns ['Dim0', 'Dim1', ...] by default. Descendants can
             override this.
         """
-        return [DIM_TEMPLATE.format(dimNr) for dimNr in range(self.nDims)] # TODO: cache?
+        return numberedDimensionNames(self.nDims)
 
 
     @property
@@ -20,9 +20,7 @@
 from __future__ import print_function
 
 import logging
-import os.path
-
-from os import listdir
+import os
 
 from cmlib import CmLib, CmLibModel, DATA_DIR
 
@@ -53,14 +51,13 @@ class CmLibSingleton(CmLib, SingletonMixin):
         # Don't import from Color Brewer since those are already included in MatPlotLib.
         # With sub-sampling the color maps similar maps can be achieved as the Color Brewer maps.
         excludeList = ['ColorBrewer2']
-        for path in listdir(cmDataDir):
-            if path in excludeList:
-                logger.debug("Not importing catalogue from exlude list: {}".format(excludeList))
-                continue
-
-            fullPath = os.path.join(cmDataDir, path)
-            if os.path.isdir(fullPath):
-                self.load_catalog(fullPath)
+        logger.debug("Not importing catalogues from exclude list: {}".format(excludeList))
+        with os.scandir(cmDataDir) as dirEntries:
+            catalogDirs = [entry.path for entry in dirEntries
+                           if entry.name not in excludeList and entry.is_dir()]
+
+        for fullPath in catalogDirs:
+            self.load_catalog(fullPath)
 
         logger.debug("Number of color maps: {}".format(len(self.color_maps)))
 
@@ -29,6 +29,8 @@ class UnknownFileRti(BaseRti):
     """ A repository tree item that represents a file of unknown type.
         The file is not opened.
     """
+    __slots__ = () # A large directory can contain many of these; don't give them a __dict__.
+
     _defaultIconGlyph = RtiIconFactory.FILE
 
     def __init__(self, nodeName='', iconColor=ICON_COLOR_UNKNOWN, fileName=''):
@@ -37,11 +39,12 @@ class UnknownFileRti(BaseRti):
         super(UnknownFileRti, self).__init__(
             nodeName=nodeName, iconColor=iconColor, fileName=fileName)
 
-        self._checkFileExists()
-
 
     def hasChildren(self):
-        """ Returns False. Leaf nodes never have children. """
+        """ Returns False. Leaf nodes never have children.
+
+            Must remain a method since the tree model and views call it.
+        """
         return False
 
 
@@ -49,6 +52,8 @@ class UnknownFileRti(BaseRti):
 class DirectoryRti(BaseRti):
     """ A directory in the repository data tree.
     """
+    __slots__ = ()
+
     _defaultIconGlyph = RtiIconFactory.FOLDER
     _defaultIconColor = RtiIconFactory.COLOR_UNKNOWN
 
@@ -57,26 +62,25 @@ class DirectoryRti(BaseRti):
         """
         super(DirectoryRti, self).__init__(
             nodeName=nodeName, iconColor=iconColor, fileName=fileName)
-        self._checkFileExists() # TODO: check for directory?
 
 
     def _fetchAllChildren(self):
         """ Gets all sub directories and files within the current directory.
             Does not fetch hidden files.
-        """
-        childItems = []
-        fileNames = sorted(os.listdir(self._fileName), key=lambda s: s.lower())
-        absFileNames = [os.path.join(self._fileName, fn) for fn in fileNames]
 
-        for fileName, absFileName in zip(fileNames, absFileNames):
-            if not fileName.startswith('.'):
-                childItem = createRtiFromFileName(absFileName)
-                childItems.append(childItem)
+            Uses a single os.scandir pass, which determines the sort key, path and the directory
+            flag of each entry at once. The directory entries know if they are a directory,
+            usually without an extra stat call, which is passed on to createRtiFromFileName.
+        """
+        with os.scandir(self._fileName) as dirEntries:
+            entries = [(entry.name.lower(), entry.path, entry.is_dir())
+                       for entry in dirEntries if not entry.name.startswith('.')]
+        entries.sort()
 
-        return childItems
+        return [createRtiFromFileName(path, isDir=isDir) for _sortKey, path, isDir in entries]
 
 
-def _detectRtiFromFileName(fileName):
+def _detectRtiFromFileName(fileName, isDir=None):
     """ Determines the type of RepoTreeItem to use given a file or directory name.
         Uses a DirectoryRti for directories without a registered extension and an UnknownFileRti
         if the file extension doesn't match one of the registered RTI globs.
@@ -89,12 +93,22 @@ def _detectRtiFromFileName(fileName):
 
          Note that directories can have an extension (e.g. extdir archives). So it is not enough to
          just test if a file is a directory.
+
+         :param fileName: file or directory name. Absolute paths must be normalized already (no
+            trailing slashes), they are used as is. Relative paths are normalized.
+         :param isDir: True if fileName is known to be a directory. If None, this is tested (but
+            only if the file extension is not registered).
     """
-    #_, extension = os.path.splitext(os.path.normpath(fileName))
-    fullPath = os.path.normpath(os.path.abspath(fileName))
+    if os.path.isabs(fileName):
+        fullPath = fileName # Paths from os.scandir (or normRealPath) are already normalized.
+    else:
+        fullPath = os.path.normpath(os.path.abspath(fileName))
     rtiRegItem = globalRtiRegistry().getRtiRegItemByExtension(fullPath)
     if rtiRegItem is None:
-        if os.path.isdir(fileName):
+        if isDir is None:
+            isDir = os.path.isdir(fileName)
+
+        if isDir:
             cls = DirectoryRti
         else:
             logger.debug("No file RTI registered for path: {}".format(fullPath))
@@ -105,12 +119,16 @@ def _detectRtiFromFileName(fileName):
     return cls, rtiRegItem
 
 
-def createRtiFromFileName(fileName):
+def createRtiFromFileName(fileName, isDir=None):
     """ Determines the type of RepoTreeItem to use given a file or directory name and creates it.
         Uses a DirectoryRti for directories without registered extensions and an UnknownFileRti if the file
         extension doesn't match one of the registered RTI extensions.
+
+        :param fileName: file or directory name. Absolute paths must be normalized already, as
+            done by normRealPath, since they are used as is (e.g. trailing slashes are kept).
+        :param isDir: True if fileName is known to be a directory. If None, this is tested.
     """
-    cls, rtiRegItem = _detectRtiFromFileName(fileName)
+    cls, rtiRegItem = _detectRtiFromFileName(fileName, isDir=isDir)
     assert not (cls is None and rtiRegItem is None), "cls and rtiRegItem both none."
 
     iconColor = rtiRegItem.iconColor if rtiRegItem else ICON_COLOR_UNKNOWN
@@ -22,11 +22,11 @@
 import logging, os
 import numpy as np
 
-from .baserti import BaseRti
+from .baserti import BaseRti, numberedDimensionNames
 from argos.repo.iconfactory import RtiIconFactory
 from argos.utils.cls import (check_is_a_sequence, check_is_a_mapping, check_is_an_array,
                                 is_a_sequence, is_a_mapping, is_an_array, type_name)
-from argos.utils.defs import DIM_TEMPLATE, SUB_DIM_TEMPLATE
+from argos.utils.defs import SUB_DIM_TEMPLATE
 from argos.utils.misc import NOT_SPECIFIED
 
 logger = logging.getLogger(__name__)
@@ -223,7 +223,7 @@ class FieldRti(BaseRti):
     def dimensionNames(self):
         """ Returns a list with the dimension names of the underlying NCDF variable
         """
-        mainArrayDims = [DIM_TEMPLATE.format(dimNr) for dimNr in range(self._array.ndim)]
+        mainArrayDims = numberedDimensionNames(self._array.ndim)
         nSubDims = len(self._subArrayShape)
         subArrayDims = [SUB_DIM_TEMPLATE.format(dimNr) for dimNr in range(nSubDims)]
         return mainArrayDims + subArrayDims
@@ -152,8 +152,7 @@ class RepoTreeModel(BaseTreeModel):
         if not parentItem.canFetchChildren():
             return
 
-        for childItem in parentItem.fetchChildren():
-            self.insertItem(childItem, parentIndex=parentIndex)
+        self.insertItems(parentItem.fetchChildren(), parentIndex=parentIndex)
 
         # Check that Rti implementation correctly sets canFetchChildren
         assert not parentItem.canFetchChildren(), \
@@ -185,7 +184,7 @@ class RepoTreeModel(BaseTreeModel):
         fileRtiParentIndex = itemIndex.parent()
         fileRti = self.getItem(itemIndex)
         position = fileRti.childNumber()
-        fileName = fileRti.fileName
+        fileName = fileRti.fileName # Already normalized when the old RTI was created.
 
         # Delete old RTI and Insert a new one instead.
         self.deleteItemAtIndex(itemIndex) # this will close the items resources.
@@ -197,6 +196,7 @@ class RepoTreeModel(BaseTreeModel):
             repoTreeItem = rtiClass.createFromFileName(fileName, fileRti.iconColor)
 
             assert repoTreeItem.parentItem is None, "repoTreeItem {!r}".format(repoTreeItem)
+            repoTreeItem.checkFileExists() # Shows an error icon if the file was deleted.
             return self.insertItem(repoTreeItem, position=position, parentIndex=fileRtiParentIndex)
 
         else:
@@ -211,17 +211,36 @@ class RepoTreeModel(BaseTreeModel):
             If position is None the child will be appended as the last child of the parent.
             Returns the index of the newly inserted RTI
         """
-        check_class(rtiRegItem, RtiRegItem, allow_none=True)
-        fileName = normRealPath(fileName)
-        logger.info("Loading data from: {!r}".format(fileName))
+        return self.loadFiles([fileName], rtiRegItem, position=position,
+                              parentIndex=parentIndex)[0]
+
+
+    def loadFiles(self, fileNames, rtiRegItem=None,
+                  position=None, parentIndex=QtCore.QModelIndex()):
+        """ Loads files in the repository as repo tree items of class rtiClass.
+            Autodetects the RTI type per file if rtiClass is None.
 
+            All RTIs are created first and then are inserted in the repository at once.
+            If position is None the children will be appended as the last children of the parent.
+            Returns a list with the indexes of the newly inserted RTIs
+        """
+        check_class(rtiRegItem, RtiRegItem, allow_none=True)
         rtiClass = rtiRegItem.getClass(tryImport=True) if rtiRegItem else None
-        if rtiClass is None:
-            repoTreeItem = createRtiFromFileName(fileName)
-        else:
-            repoTreeItem = rtiClass.createFromFileName(fileName, rtiRegItem.iconColor)
 
-        assert repoTreeItem.parentItem is None, "repoTreeItem {!r}".format(repoTreeItem)
-        return self.insertItem(repoTreeItem, position=position, parentIndex=parentIndex)
+        repoTreeItems = []
+        for fileName in fileNames:
+            fileName = normRealPath(fileName)
+            logger.info("Loading data from: {!r}".format(fileName))
+
+            if rtiClass is None:
+                repoTreeItem = createRtiFromFileName(fileName)
+            else:
+                repoTreeItem = rtiClass.createFromFileName(fileName, rtiRegItem.iconColor)
+
+            assert repoTreeItem.parentItem is None, "repoTreeItem {!r}".format(repoTreeItem)
+            repoTreeItem.checkFileExists() # Shows an error icon if the file doesn't exist.
+            repoTreeItems.append(repoTreeItem)
+
+        return self.insertItems(repoTreeItems, position=position, parentIndex=parentIndex)
 
 
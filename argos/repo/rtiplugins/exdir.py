@@ -335,9 +335,8 @@ class ExdirDatasetRti(BaseRti):
         self._isStructured = bool(self._exdirDataset.dtype.names)
 
         exdirDir = str(self._exdirDataset.directory) # convert to string for Python 3.5
-        fileNames = os.listdir(os.path.abspath(exdirDir))
-        absFileNames = [os.path.join(exdirDir, fn) for fn in fileNames]
-        self._hasRaws = sum([os.path.isdir(f) for f in absFileNames]) > 0
+        with os.scandir(exdirDir) as dirEntries:
+            self._hasRaws = any(entry.is_dir() for entry in dirEntries)
 
     def hasChildren(self):
         """ Returns True if the variable has a structured type, otherwise returns False.
@@ -412,14 +411,14 @@ class ExdirDatasetRti(BaseRti):
         # Add raw directories
         if self._hasRaws:
             exdirDir = str(self._exdirDataset.directory) # convert to string for Python 3.5
-            fileNames = os.listdir(os.path.abspath(exdirDir))
-            absFileNames = [os.path.join(exdirDir, fn) for fn in fileNames]
+            with os.scandir(exdirDir) as dirEntries:
+                rawNames = [entry.name for entry in dirEntries
+                            if entry.is_dir() and not entry.name.startswith('.')]
 
-            for fileName, absFileName in zip(fileNames, absFileNames):
-                if os.path.isdir(absFileName) and not fileName.startswith('.'):
-                    childItems.append(ExdirRawRti(
-                        self._exdirDataset.require_raw(fileName), nodeName=fileName,
-                        fileName=self.fileName, iconColor=self.iconColor))
+            for rawName in rawNames:
+                childItems.append(ExdirRawRti(
+                    self._exdirDataset.require_raw(rawName), nodeName=rawName,
+                    fileName=self.fileName, iconColor=self.iconColor))
 
         return childItems
 
@@ -447,14 +446,11 @@ class ExdirRawRti(BaseRti):
 
         childItems = []
         exdirDir = str(self._exdirRaw.directory) # convert to string for Python 3.5
-        absPaths = os.path.abspath(exdirDir)
-        fileNames = os.listdir(absPaths)
-        absFileNames = [os.path.join(exdirDir, fn) for fn in fileNames]
-
-        for fileName, absFileName in zip(fileNames, absFileNames):
-            if not fileName.startswith('.'):
-                childItem = createRtiFromFileName(absFileName)
-                childItems.append(childItem)
+        with os.scandir(exdirDir) as dirEntries:
+            for entry in dirEntries:
+                if not entry.name.startswith('.'):
+                    childItem = createRtiFromFileName(entry.path, isDir=entry.is_dir())
+                    childItems.append(childItem)
 
         return childItems
 
@@ -524,7 +520,6 @@ class ExdirFileRti(ExdirGroupRti):
         """ Constructor
         """
         super(ExdirFileRti, self).__init__(None, nodeName, fileName=fileName, iconColor=iconColor)
-        self._checkFileExists()
 
     def _openResources(self):
         """ Opens the root Dataset.
@@ -565,7 +565,6 @@ class H5pyFileRti(H5pyGroupRti):
         """ Constructor
         """
         super(H5pyFileRti, self).__init__(None, nodeName, fileName=fileName, iconColor=iconColor)
-        self._checkFileExists()
 
     def _openResources(self):
         """ Opens the root Dataset.
@@ -455,7 +455,6 @@ class NcdfFileRti(NcdfGroupRti):
         """ Constructor
         """
         super(NcdfFileRti, self).__init__(None, nodeName, fileName=fileName, iconColor=iconColor)
-        self._checkFileExists()
 
     def _openResources(self):
         """ Opens the root Dataset.
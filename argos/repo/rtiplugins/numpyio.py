@@ -46,7 +46,6 @@ class NumpyTextFileRti(ArrayRti):
         """
         super(NumpyTextFileRti, self).__init__(None, nodeName=nodeName, fileName=fileName,
                                                iconColor=iconColor)
-        self._checkFileExists()
 
 
     def hasChildren(self):
@@ -96,7 +95,6 @@ class NumpyBinaryFileRti(ArrayRti):
         """
         super(NumpyBinaryFileRti, self).__init__(None, nodeName=nodeName, fileName=fileName,
                                                  iconColor=iconColor)
-        self._checkFileExists()
 
 
     def hasChildren(self):
@@ -138,7 +136,6 @@ class NumpyCompressedFileRti(MappingRti):
         super(NumpyCompressedFileRti, self).__init__(None,
                                                      nodeName=nodeName, fileName=fileName,
                                                      iconColor=iconColor)
-        self._checkFileExists()
 
 
     def hasChildren(self):
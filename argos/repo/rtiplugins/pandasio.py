@@ -340,7 +340,6 @@ class PandasCsvFileRti(PandasDataFrameRti):
         """
         super(PandasCsvFileRti, self).__init__(ndFrame=None, nodeName=nodeName, fileName=fileName,
                                                iconColor=iconColor, standAlone=True)
-        self._checkFileExists()
         self._ndFrame = None
 
 
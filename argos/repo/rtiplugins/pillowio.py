@@ -69,7 +69,6 @@ class PillowFileRti(ArrayRti):
         """
         super(PillowFileRti, self).__init__(None, nodeName=nodeName, fileName=fileName,
                                             iconColor=iconColor)
-        self._checkFileExists()
         self._bands = [] # image band names
 
 
@@ -46,7 +46,6 @@ class MatlabFileRti(MappingRti):
         """
         super(MatlabFileRti, self).__init__(None, nodeName=nodeName, fileName=fileName,
                                             iconColor=iconColor)
-        self._checkFileExists()
 
 
     def hasChildren(self):
@@ -82,7 +81,6 @@ class IdlSaveFileRti(MappingRti):
         """
         super(IdlSaveFileRti, self).__init__(None, nodeName=nodeName, fileName=fileName,
                                              iconColor=iconColor)
-        self._checkFileExists()
 
 
     def hasChildren(self):
@@ -117,7 +115,6 @@ class WavFileRti(ArrayRti):
         """
         super(WavFileRti, self).__init__(None, nodeName=nodeName, fileName=fileName,
                                          iconColor=iconColor)
-        self._checkFileExists()
 
 
     def hasChildren(self):
@@ -19,14 +19,18 @@
 
 """
 
+import importlib
 import logging
 import numbers
 import re
 
-import numpy as np
-import numpy.ma as ma
-
 from argos.external import six
+from argos.utils.lazyimport import LazyImport
+
+# Numpy is only needed by a few functions. Importing it lazily keeps the start up time of
+# 'argos --version' and friends low.
+np = LazyImport('numpy')
+ma = LazyImport('numpy.ma')
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +148,13 @@ def setting_str_to_bool(s):
 # Type checking #
 #################
 
+# Types (tuples) bound at module level, so that to_string and the is_* functions don't have to
+# look them up in each call.
+_SEQ_TYPES = (list, tuple)
+_STRING_TYPES = six.string_types
+_TEXT_TYPE = six.text_type
+_BINARY_TYPE = six.binary_type
+
 # Use '{!r}' as default float format for Python 2. This will convert the floats with repr(), which
 # is necessary because str() or an empty format string will only print 2 decimals behind the point.
 # In Python 3 this is not necessary: all relevant decimals are printed.
@@ -174,7 +185,8 @@ def to_string(var, masked=None, decode_bytes='utf-8', maskFormat='', strFormat='
     #logger.debug("to_string: {!r} ({})".format(var, type(var)))
 
     # Decode and select correct format specifier.
-    if is_binary(var):
+    # The is_binary, is_text and is_a_string tests are inlined. This function is called per cell.
+    if isinstance(var, _BINARY_TYPE):
         fmt = strFormat
         try:
             decodedVar = var.decode(decode_bytes, 'replace')
@@ -182,10 +194,10 @@ def to_string(var, masked=None, decode_bytes='utf-8', maskFormat='', strFormat='
             # Add URL to exception message.
             raise LookupError("{}\n\nFor a list of encodings in Python see: {}"
                               .format(ex, URL_PYTHON_ENCODINGS_DOC))
-    elif is_text(var):
+    elif isinstance(var, _TEXT_TYPE):
         fmt = strFormat
-        decodedVar = six.text_type(var)
-    elif is_a_string(var):
+        decodedVar = _TEXT_TYPE(var)
+    elif isinstance(var, _STRING_TYPES):
         fmt = strFormat
         decodedVar = str(var)
     elif isinstance(var, numbers.Integral):
@@ -232,7 +244,7 @@ def is_a_string(var, allow_none=False):
 
         Also returns True if the var is a numpy string (numpy.string_, numpy.unicode_).
     """
-    return isinstance(var, six.string_types) or (var is None and allow_none)
+    return isinstance(var, _STRING_TYPES) or (var is None and allow_none)
 
 
 def check_is_a_string(var, allow_none=False):
@@ -254,7 +266,7 @@ def is_text(var, allow_none=False):
 
         Also works with the corresponding numpy types.
     """
-    return isinstance(var, six.text_type) or (var is None and allow_none)
+    return isinstance(var, _TEXT_TYPE) or (var is None and allow_none)
 
 # Not used yet
 # def check_is_text(var, allow_none=False):
@@ -276,7 +288,7 @@ def is_binary(var, allow_none=False):
 
         Also works with the corresponding numpy types.
     """
-    return isinstance(var, six.binary_type) or (var is None and allow_none)
+    return isinstance(var, _BINARY_TYPE) or (var is None and allow_none)
 
 
 # Not used yet
@@ -303,7 +315,7 @@ def is_binary(var, allow_none=False):
 def is_a_sequence(var, allow_none=False):
     """ Returns True if var is a list or a tuple (but not a string!)
     """
-    return isinstance(var, (list, tuple)) or (var is None and allow_none)
+    return isinstance(var, _SEQ_TYPES) or (var is None and allow_none)
 
 
 def check_is_a_sequence(var, allow_none=False):
@@ -369,16 +381,16 @@ def array_kind_label(array):
     return KIND_LABEL[array.dtype.kind]
 
 
+_REAL_NUMBER_KINDS = frozenset('iuf')
+
 def array_has_real_numbers(array):
     """ Uses the dtype kind of the numpy array to determine if it represents real numbers.
 
         That is, the array kind should be one of: i u f
 
-        Possible dtype.kind values.
-
+        See KIND_LABEL for the possible dtype.kind values.
     """
-    kind = array.dtype.kind
-    return kind in 'iuf'
+    return array.dtype.kind in _REAL_NUMBER_KINDS
 
 
 def check_class(obj, target_class, allow_none = False):
@@ -447,8 +459,6 @@ def get_full_class_name(obj):
 # Importing #
 #############
 
-# TODO: use importlib.import_module?
-# Perhaps in Python 3. As long as the code below works there is no need to change it.
 def import_symbol(full_symbol_name):
     """ Imports a symbol (e.g. class, variable, etc) from a dot separated name.
         Can be used to create a class whose type is only known at run-time.
@@ -465,8 +475,17 @@ def import_symbol(full_symbol_name):
         module_name = str(module_name) # convert from possible unicode
         symbol_name = str(symbol_name)
         #logger.debug("From module {} importing {!r}".format(module_name, symbol_name))
-        module = __import__(module_name, fromlist=[symbol_name])
-        cls = getattr(module, symbol_name)
+        module = importlib.import_module(module_name)
+        try:
+            cls = getattr(module, symbol_name)
+        except AttributeError:
+            # The symbol may be a submodule that is not yet imported (__import__ with a fromlist
+            # would have imported it).
+            try:
+                cls = importlib.import_module(full_symbol_name)
+            except ImportError:
+                raise AttributeError("module {!r} has no attribute {!r}"
+                                     .format(module_name, symbol_name))
         return cls
     elif len(parts) == 1:
         # No module part, only a class name. If you want to create a class
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of Argos.
+#
+# Argos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Argos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Argos. If not, see <http://www.gnu.org/licenses/>.
+
+""" Deferred importing of modules.
+
+    IMPORTANT: this module may only import from the standard library. It is used by argos.main,
+    which must be importable without PyQt, numpy, etc being installed.
+"""
+import importlib
+import types
+
+
+class LazyImport(types.ModuleType):
+    """ Proxy for a module that is only imported when one of its attributes is accessed.
+
+        Use this for modules that are expensive to import (e.g. PyQt or numpy) and that are not
+        needed in all code paths. For example:
+
+            np = LazyImport('numpy')
+
+            def myFunction():
+                return np.zeros(5)  # numpy is imported here, the first time myFunction is called.
+
+        After the import, the module's namespace is copied into the proxy so that subsequent
+        attribute access is as fast as for a regular module.
+    """
+    def __init__(self, moduleName):
+        """ Constructor
+
+            :param moduleName: absolute name of the module, e.g. 'argos.qt.bindings'
+        """
+        super(LazyImport, self).__init__(moduleName)
+        self._lazyModule = None
+
+
+    def __repr__(self):
+        if self._lazyModule is None:
+            return "<LazyImport: {!r} (not yet imported)>".format(self.__name__)
+        else:
+            return "<LazyImport: {!r}>".format(self._lazyModule)
+
+
+    @property
+    def isImported(self):
+        """ Returns True if the underlying module has been imported.
+        """
+        return self._lazyModule is not None
+
+
+    def _loadModule(self):
+        """ Imports the underlying module (if not done already) and returns it.
+        """
+        if self._lazyModule is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__.update(module.__dict__)
+            self._lazyModule = module
+        return self._lazyModule
+
+
+    def __getattr__(self, name):
+        """ Is only called when the attribute is not (yet) in the proxy's namespace.
+        """
+        return getattr(self._loadModule(), name)
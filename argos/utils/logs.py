@@ -107,6 +107,46 @@ def findStreamHandlersInConfig():
 
 
 
+def _configuredHandlers():
+    """ Returns a list with the handlers of the root logger and of all other existing loggers.
+    """
+    loggers = [logging.getLogger()]
+    loggers.extend(obj for obj in logging.Logger.manager.loggerDict.values()
+                   if isinstance(obj, logging.Logger))
+    return [handler for logr in loggers for handler in logr.handlers]
+
+
+def setRecordInfoFlags():
+    """ Only lets log records collect thread and process info if a formatter may use it.
+
+        Sets logging.logThreads, logging.logProcesses and logging.logMultiprocessing, using the
+        formatters of the handlers that are currently configured. Works for all format styles
+        ('%', '{' and '$') since only the field names are searched for, which may give a false
+        positive but never a false negative. Formatters of custom classes may use any record
+        attribute, so if there is one all flags are set.
+    """
+    useThreads = useProcesses = useProcessNames = False
+
+    for handler in _configuredHandlers():
+        formatter = handler.formatter
+        if formatter is None:
+            continue # Uses logging._defaultFormatter, which only logs the message.
+
+        if type(formatter) is not logging.Formatter:
+            useThreads = useProcesses = useProcessNames = True
+            break
+
+        fmt = formatter._fmt or ''
+        useThreads = useThreads or 'thread' in fmt  # thread and threadName
+        useProcesses = useProcesses or 'process' in fmt
+        useProcessNames = useProcessNames or 'processName' in fmt
+
+    logging.logThreads = useThreads
+    logging.logProcesses = useProcesses
+    logging.logMultiprocessing = useProcessNames
+
+
+
 def initLogging(configFileName=None, streamLogLevel=None):
     """ Configures logging given a (JSON) config file name.
 
@@ -133,6 +173,7 @@ def initLogging(configFileName=None, streamLogLevel=None):
     configDict = replaceStringsInDict(configDict, "@logDir@", logDir)
 
     logging.config.dictConfig(configDict)
+    setRecordInfoFlags()
 
     if streamLogLevel:
         # Using getLevelName to get the level number. This undocumented behavior has been upgraded
@@ -101,12 +101,14 @@ def replaceStringsInDict(obj, old, new):
         return obj
 
 
-def remove_process_serial_number(arg_list):
-    """ Creates a copy of a list (typically sys.argv) where the strings that
-        start with '-psn_0_' are removed.
+_PSN_PREFIX = "-psn_0_"
+
+def remove_process_serial_number(arg_list, _prefix=_PSN_PREFIX):
+    """ Returns a generator over a list (typically sys.argv) that skips the strings that
+        start with '-psn_0_'. Use list() on the result if you need a copy of the list.
 
         These are the process serial number used by the OS-X open command
         to bring applications to the front. They clash with argparse.
         See: http://hintsforums.macworld.com/showthread.php?t=11978
     """
-    return [arg for arg in arg_list if not arg.startswith("-psn_0_")]
+    return (arg for arg in arg_list if not arg.startswith(_prefix))
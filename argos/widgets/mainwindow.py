@@ -783,15 +783,14 @@ class MainWindow(QtWidgets.QMainWindow):
             # Only add files that were added via the dialog box (not via the command line).
             self._argosApplication.addToRecentFiles(fileNames, rtiRegItemName)
 
-        fileRootIndex = None
         logger.debug("Opening file names: {}".format(fileNames))
-        for fileName in fileNames:
-            fileRootIndex = self.argosApplication.repo.loadFile(fileName, rtiRegItem=rtiRegItem)
+        fileRootIndexes = self.argosApplication.repo.loadFiles(fileNames, rtiRegItem=rtiRegItem)
+        for fileRootIndex in fileRootIndexes:
             self.repoWidget.repoTreeView.setExpanded(fileRootIndex, True)
 
         # Select last opened file
-        if fileRootIndex is not None:
-            self.repoWidget.repoTreeView.setCurrentIndex(fileRootIndex)
+        if fileRootIndexes:
+            self.repoWidget.repoTreeView.setCurrentIndex(fileRootIndexes[-1])
 
 
     def selectRtiByPath(self, path):
@@ -22,10 +22,27 @@ from __future__ import print_function
 import logging
 import os.path
 
-from argos.qt import QtWidgets
+from argos.info import icons_directory
+from argos.qt import QtGui, QtWidgets
 
 logger = logging.getLogger(__name__)
 
+_ICONS = {} # Cache of the QIcons created by loadIcon, per absolute file name.
+
+
+def loadIcon(fileName):
+    """ Returns a QIcon of an icon file. Relative file names are relative to the icons directory.
+
+        The icons are cached, so that widgets that use the same icon file share one QIcon (and the
+        pixmaps that Qt renders and caches for it).
+    """
+    fileName = os.path.join(icons_directory(), fileName) # Does nothing if fileName is absolute
+    try:
+        return _ICONS[fileName]
+    except KeyError:
+        icon = _ICONS[fileName] = QtGui.QIcon(fileName)
+        return icon
+
 
 def setWidgetSizePolicy(widget, hor=None, ver=None):
     """ Sets horizontal and/or vertical size policy on a widget
@@ -66,18 +83,24 @@ def setApplicationQtStyle(styleName):
             .format(qApp.style().objectName(), styleName))
 
 
-def setApplicationStyleSheet(fileName):
-    """ Reads the style sheet from file and set it as application style sheet.
+def readStyleSheet(fileName):
+    """ Reads the style sheet from file and returns its contents.
+
+        Returns None (and logs a warning) if the file could not be read. The file is opened
+        directly instead of first testing if it exists.
     """
-    fileName = os.path.abspath(fileName)
     logger.debug("Reading qss from: {}".format(fileName))
     try:
         with open(fileName) as input:
-            qss = input.read()
+            return input.read()
     except Exception as ex:
         logger.warning("Unable to read style sheet from '{}'. Reason: {}".format(fileName, ex))
-        return
+        return None
 
+
+def setApplicationStyleSheet(qss):
+    """ Sets the style sheet contents (not the file name) as application style sheet.
+    """
     QtWidgets.QApplication.instance().setStyleSheet(qss)
 
 
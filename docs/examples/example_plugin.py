@@ -41,7 +41,6 @@ class TestFileRti(BaseRti):
         """ Constructor
         """
         super(TestFileRti, self).__init__(nodeName=nodeName, fileName=fileName)
-        self._checkFileExists()
 
 
 #    def _openResources(self):
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Tests the discovery of plugins that are registered as entry points
+"""
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+from argos.application import qApplicationSingleton
+from argos.reg.basereg import findEntryPoints
+from argos.reg.dialog import PluginsDialog
+from argos.inspector.registry import InspectorRegistry, INSPECTOR_ENTRY_POINT_GROUP
+
+
+ENTRY_POINTS = [
+    SimpleNamespace(name='My Inspector', value='mypackage.mymodule:MyInspector'),
+    SimpleNamespace(name='Extras', value='mypackage.other:OtherInspector [plot, gui]'),
+]
+
+CONFIG = [
+    {'name': 'Table', 'shortCut': 'Ctrl+3',
+     'absClassName': 'argos.inspector.qtplugins.table.TableInspector', 'pythonPath': ''},
+    {'name': 'Extras', 'shortCut': 'Ctrl+5',
+     'absClassName': 'mypackage.other.OtherInspector', 'pythonPath': ''},
+]
+
+
+class SelectableEntryPoints(object):
+    """ Mimics the EntryPoints object that importlib.metadata returns in Python >= 3.10
+    """
+    def select(self, group):
+        return ENTRY_POINTS if group == INSPECTOR_ENTRY_POINT_GROUP else []
+
+
+class TestFindEntryPoints(unittest.TestCase):
+
+    def test_select(self):
+        with mock.patch('importlib.metadata.entry_points', return_value=SelectableEntryPoints()):
+            self.assertEqual(findEntryPoints(INSPECTOR_ENTRY_POINT_GROUP),
+                             [('My Inspector', 'mypackage.mymodule.MyInspector'),
+                              ('Extras', 'mypackage.other.OtherInspector')])
+            self.assertEqual(findEntryPoints('other.group'), [])
+
+
+    def test_dict(self):
+        """ Python < 3.10 returns a dictionary that maps groups to entry points
+        """
+        allEntryPoints = {INSPECTOR_ENTRY_POINT_GROUP: ENTRY_POINTS[:1]}
+        with mock.patch('importlib.metadata.entry_points', return_value=allEntryPoints):
+            self.assertEqual(findEntryPoints(INSPECTOR_ENTRY_POINT_GROUP),
+                             [('My Inspector', 'mypackage.mymodule.MyInspector')])
+            self.assertEqual(findEntryPoints('other.group'), [])
+
+
+    def test_error(self):
+        with mock.patch('importlib.metadata.entry_points', side_effect=RuntimeError("broken")):
+            self.assertEqual(findEntryPoints(INSPECTOR_ENTRY_POINT_GROUP), [])
+
+
+    def test_addNewEntryPoints(self):
+        """ Entry points that were not offered before are added after unmarshalling.
+        """
+        registry = InspectorRegistry()
+        with mock.patch('importlib.metadata.entry_points', return_value=SelectableEntryPoints()):
+            registry.unmarshall(CONFIG)
+            registry.addNewEntryPoints(None) # Settings of older versions have no offered list
+
+        self.assertEqual([item.name for item in registry.items],
+                         ['Table', 'Extras', 'My Inspector'])
+        self.assertEqual(registry.items[1].shortCut, 'Ctrl+5') # Config item is kept
+        self.assertEqual(registry.items[2].absClassName, 'mypackage.mymodule.MyInspector')
+        self.assertEqual(registry.offeredEntryPoints, ['Extras', 'My Inspector'])
+
+        # Inspectors that were offered before are not added again
+        registry = InspectorRegistry()
+        with mock.patch('importlib.metadata.entry_points', return_value=SelectableEntryPoints()):
+            registry.unmarshall(CONFIG[:1])
+            registry.addNewEntryPoints(['Extras'])
+
+        self.assertEqual([item.name for item in registry.items], ['Table', 'My Inspector'])
+
+
+    def test_deleteInDialog(self):
+        """ An entry point inspector that the user deletes in the plugin dialog stays deleted.
+        """
+        qApplicationSingleton()
+
+        registry = InspectorRegistry()
+        with mock.patch('importlib.metadata.entry_points', return_value=SelectableEntryPoints()):
+            registry.unmarshall(CONFIG)
+            registry.addNewEntryPoints(None)
+
+            dialog = PluginsDialog("Inspector", registry)
+            names = [item.name for item in dialog._tableModel.store.items]
+            dialog._tableModel.popItemAtRow(names.index('My Inspector'))
+            dialog.accept()
+            self.assertEqual([item.name for item in registry.items], ['Table', 'Extras'])
+
+            # Restart with the saved settings.
+            savedCfg, savedOffered = registry.marshall(), registry.offeredEntryPoints
+            registry = InspectorRegistry()
+            registry.unmarshall(savedCfg)
+            registry.addNewEntryPoints(savedOffered)
+            self.assertEqual([item.name for item in registry.items], ['Table', 'Extras'])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,15 @@
 # -*- coding: utf-8 -*-
 
 
-import unittest
+import os, shutil, tempfile, unittest
 import numpy as np
 
+from unittest import mock
 from numpy.testing import assert_array_equal
+from argos.application import qApplicationSingleton
 from argos.repo.memoryrtis import ArrayRti
+from argos.repo.filesytemrtis import createRtiFromFileName, UnknownFileRti
+from argos.repo.iconfactory import RtiIconFactory, ICON_COLOR_UNKNOWN
 
 
 
@@ -39,6 +43,61 @@ class TestUntypedCtis(unittest.TestCase):
 
 
 
+class TestFileSystemRtis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        qApplicationSingleton() # Needed to render the icons
+
+
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp()
+        self.fileName = os.path.join(self.tempDir, 'data.unknown_extension')
+        with open(self.fileName, 'w'):
+            pass
+
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+
+    def test_scanDoesNotResolvePaths(self):
+        """ The children of a directory get their paths from os.scandir, which are absolute and
+            normalized already. No realpath or abspath should be called per child.
+        """
+        for idx in range(5):
+            with open(os.path.join(self.tempDir, 'file{}.unknown_extension'.format(idx)), 'w'):
+                pass
+        dirRti = createRtiFromFileName(self.tempDir)
+
+        with mock.patch('os.path.realpath', wraps=os.path.realpath) as realPathMock, \
+                mock.patch('os.path.abspath', wraps=os.path.abspath) as absPathMock:
+            children = dirRti.fetchChildren()
+
+        self.assertEqual(len(children), 6)
+        self.assertEqual(children[0].nodeName, 'data.unknown_extension')
+        self.assertEqual(children[0].fileName, self.fileName)
+        self.assertEqual(realPathMock.call_count, 0)
+        self.assertEqual(absPathMock.call_count, 0)
+
+
+    def test_unknownFileIcon(self):
+        """ An unknown file is never visited, so it should always show the closed file icon.
+        """
+        rti = createRtiFromFileName(self.fileName)
+        self.assertIsInstance(rti, UnknownFileRti)
+        self.assertFalse(rti.hasChildren())
+
+        iconFactory = RtiIconFactory.singleton()
+        closedIcon = iconFactory.getIcon(RtiIconFactory.FILE, isOpen=False,
+                                         color=ICON_COLOR_UNKNOWN)
+        self.assertIs(rti.decoration, closedIcon)
+
+        rti.close()
+        self.assertIs(rti.decoration, closedIcon)
+
+
+
 if __name__ == '__main__':
     unittest.main()
 
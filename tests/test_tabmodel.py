@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Tests the table model that forms the base of the registries
+"""
+import unittest
+
+from argos.qt import Qt
+from argos.reg.tabmodel import BaseItem, BaseItemStore, BaseTableModel
+
+
+class ColorItem(BaseItem):
+    FIELDS = ['name', 'color']
+    LABELS = ['Name', 'Color']
+    STRETCH = [True, False]
+
+
+class ColorStore(BaseItemStore):
+    ITEM_CLASS = ColorItem
+
+
+class TestBaseTableModel(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ColorStore()
+        self.store.unmarshall([{'name': 'red', 'color': '#FF0000'},
+                               {'name': 'green', 'color': '#00FF00'}])
+        self.model = BaseTableModel(self.store)
+
+
+    def getCell(self, row, col, role=Qt.DisplayRole):
+        return self.model.data(self.model.index(row, col), role)
+
+
+    def test_data(self):
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.columnCount(), 2)
+        self.assertEqual(self.getCell(0, 0), 'red')
+        self.assertEqual(self.getCell(1, 1), '#00FF00')
+        self.assertEqual(self.getCell(1, 1, Qt.EditRole), '#00FF00')
+        self.assertIsNone(self.getCell(1, 1, Qt.FontRole))
+        self.assertIsNone(self.model.data(self.model.index(5, 0)))
+
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal, Qt.DisplayRole), 'Color')
+        self.assertEqual(self.model.headerData(1, Qt.Vertical, Qt.DisplayRole), '1')
+        self.assertIsNone(self.model.headerData(1, Qt.Vertical, Qt.ToolTipRole))
+
+
+    def test_modifications(self):
+        self.assertTrue(self.model.setData(self.model.index(1, 1), '#008000'))
+        self.assertEqual(self.getCell(1, 1), '#008000')
+
+        self.model.insertItem(ColorItem(name='blue', color='#0000FF'), row=1)
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual([self.getCell(row, 0) for row in range(3)], ['red', 'blue', 'green'])
+
+        self.model.moveItem(0, 2)
+        self.assertEqual([self.getCell(row, 0) for row in range(3)], ['blue', 'green', 'red'])
+
+        self.model.popItemAtRow(0)
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual([self.getCell(row, 1) for row in range(2)], ['#008000', '#FF0000'])
+        self.assertEqual(self.model.headerData(1, Qt.Vertical, Qt.DisplayRole), '1')
+
+
+    def test_reset(self):
+        self.model.beginResetModel()
+        try:
+            self.store.unmarshall([{'name': 'black', 'color': '#000000'}])
+        finally:
+            self.model.endResetModel()
+
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual(self.getCell(0, 0), 'black')
+        self.assertEqual(self.getCell(0, 1), '#000000')
+        self.assertIs(self.model.itemFromIndex(self.model.index(0, 0)), self.store.items[0])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -140,6 +140,23 @@ class TestGetByPath(unittest.TestCase):
         self.assertIs(checkItem, self.item2)
 
 
+    def testInsertItems(self):
+
+        newItems = [BaseTreeItem('itemA'), BaseTreeItem('itemB')]
+        newIndexes = self.model.insertItems(newItems, position=1, parentIndex=self.index0)
+        self.assertEqual([index.row() for index in newIndexes], [1, 2])
+        self.assertEqual([self.model.getItem(index) for index in newIndexes], newItems)
+        self.assertEqual([child.nodeName for child in self.item0.childItems],
+                         ['item1', 'itemA', 'itemB', 'item1a'])
+
+        checkItem, _checkIndex = self.getLastItem('item0/itemB')
+        self.assertIs(checkItem, newItems[1])
+
+        # Inserting an empty list does nothing
+        self.assertEqual(self.model.insertItems([]), [])
+        self.assertEqual(self.model.rowCount(), 2)
+
+
 if __name__ == '__main__':
     logging.basicConfig(level='DEBUG', stream=sys.stderr,
                         format='%(asctime)s %(filename)25s:%(lineno)-4d : %(levelname)-7s: %(message)s')
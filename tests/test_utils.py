@@ -5,9 +5,12 @@ Tests functionality from the utils package
 
 """
 
+import logging
 import unittest
 
 from argos.utils.cls import is_a_string, is_text, is_binary
+from argos.utils.lazyimport import LazyImport
+from argos.utils.logs import setRecordInfoFlags
 from argos.utils.misc import python2
 import numpy as np
 
@@ -105,6 +108,65 @@ class TestStringTypeDetection(unittest.TestCase):
         pass
 
 
+class TestLazyImport(unittest.TestCase):
+
+    def test_lazy_import(self):
+        lazyModule = LazyImport('json')
+        self.assertFalse(lazyModule.isImported)
+
+        self.assertEqual(lazyModule.dumps([1, 2]), '[1, 2]')
+        self.assertTrue(lazyModule.isImported)
+
+        self.assertRaises(AttributeError, getattr, lazyModule, 'nonExisting')
+
+
+    def test_import_error(self):
+        lazyModule = LazyImport('argos.nonexisting_module')
+        self.assertRaises(ImportError, getattr, lazyModule, 'nonExisting')
+        self.assertFalse(lazyModule.isImported)
+
+
+
+class TestRecordInfoFlags(unittest.TestCase):
+
+    def setUp(self):
+        self.orgFlags = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+        self.handler = logging.NullHandler()
+        self.logger = logging.getLogger('argos.test_record_info_flags')
+        self.logger.addHandler(self.handler)
+
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        logging.logThreads, logging.logProcesses, logging.logMultiprocessing = self.orgFlags
+
+
+    def test_styles(self):
+        self.handler.setFormatter(logging.Formatter('%(threadName)s: %(message)s'))
+        setRecordInfoFlags()
+        self.assertTrue(logging.logThreads)
+
+        self.handler.setFormatter(logging.Formatter('{processName} {message}', style='{'))
+        setRecordInfoFlags()
+        self.assertTrue(logging.logMultiprocessing)
+
+        self.handler.setFormatter(logging.Formatter('$process $message', style='$'))
+        setRecordInfoFlags()
+        self.assertTrue(logging.logProcesses)
+
+
+    def test_customFormatter(self):
+        class MyFormatter(logging.Formatter):
+            pass
+
+        self.handler.setFormatter(MyFormatter('%(message)s'))
+        setRecordInfoFlags()
+        self.assertTrue(logging.logThreads)
+        self.assertTrue(logging.logProcesses)
+        self.assertTrue(logging.logMultiprocessing)
+
+
+
 if __name__ == '__main__':
     unittest.main()
 